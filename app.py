@@ -1,17 +1,42 @@
 from __future__ import annotations
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import altair as alt
+import httpx
+import logging
 from typing import List, Dict
 
 from imdb import Cinemagoer
 from utils.Preprocessor import preprocess_reviews
-from utils.FindMovie import search_movies, find_and_get_reviews_link
-from utils.Scrapper import extract_imdb_reviews
+from utils.FindMovie import search_movies, get_title_id
+from utils.Scrapper import NoReviewsFound, create_driver, extract_imdb_reviews, fetch_imdb_reviews
 from utils.SentimentAnalysis import analyze_sentiment
 
-ia = Cinemagoer()
+logger = logging.getLogger(__name__)
+
+@st.cache_resource
+def get_ia() -> Cinemagoer:
+    return Cinemagoer()
+
+def driver_is_alive(driver) -> bool:
+    try:
+        return driver.session_id is not None and driver.current_url is not None
+    except Exception:
+        return False
+
+def quit_driver(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+# One Chrome instance per browser session, so concurrent scrapes never share a page;
+# recreated if it has crashed and quit when the session ends
+@st.cache_resource(scope="session", validate=driver_is_alive, on_release=quit_driver)
+def get_driver():
+    return create_driver()
 
 st.set_page_config(
     page_title="IMDb Review Sentiment Analyzer",
@@ -36,19 +61,42 @@ div[data-baseweb="select"] > div {
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_movie_candidates(query: str) -> List[Dict]:
-    return search_movies(ia, query)
-
-@st.cache_data(show_spinner=False)
-def fetch_reviews(movie_title: str) -> List[str]:
-    url = find_and_get_reviews_link(ia, movie_title)
-    return extract_imdb_reviews(url)
-
-@st.cache_data(show_spinner=False)
+    return search_movies(get_ia(), query)
+
+# Persisted to disk so reviews survive app restarts (persisted caches don't support ttl)
+@st.cache_data(persist="disk", show_spinner=False)
+def fetch_reviews(movie_id: str) -> List[str]:
+    tconst = get_title_id(movie_id)
+    try:
+        reviews = fetch_imdb_reviews(tconst)
+    except (httpx.HTTPError, RuntimeError, KeyError):
+        # API unreachable or its response changed: fall back to scraping the rendered reviews page
+        logger.warning("GraphQL review fetch failed for %s, falling back to Selenium", tconst, exc_info=True)
+        reviews = extract_imdb_reviews(f"https://www.imdb.com/title/{tconst}/reviews", driver=get_driver())
+
+    if not reviews:
+        # Raising keeps the empty result out of the persisted cache, so it is retried next time
+        raise NoReviewsFound(f"No reviews found for {tconst}")
+
+    return reviews
+
+@st.cache_data(persist="disk", show_spinner=False)
 def sentiment_pipeline(raw_reviews: List[str]) -> pd.DataFrame:
-    processed = preprocess_reviews(pd.Series(raw_reviews))
-    return analyze_sentiment(processed, pd.Series(raw_reviews))
+    raw = pd.Series(raw_reviews, copy=False)
+    processed = preprocess_reviews(raw)
+    df = analyze_sentiment(processed, raw)
+
+    # Derived columns are cached along with the scores, so reruns don't recompute them
+    p = df['polarity'].to_numpy()
+    df['sentiment'] = pd.Categorical(
+        np.select([p > 0.05, p < -0.05], ['Positive', 'Negative'], 'Neutral'),
+        categories=['Positive', 'Neutral', 'Negative']
+    )
+    df['emoji'] = np.select([p > 0.3, p > 0.05, p < -0.3, p < -0.05], ['😁', '🙂', '😔', '😐'], '😑')
+
+    return df
 
 def polarity_to_emoji(polarity: float) -> str:
     if polarity > 0.3:
@@ -111,17 +159,17 @@ def main() -> None:
 
         options: Dict[str, str] = {}
         for m in candidates:
-            title = m.get('title', 'Unknown')
-            year = m.get('year')
+            title = m.data.get('title', 'Unknown')
+            year = m.data.get('year')
             label = f"{title} ({year})" if year else title
-            options[label] = title
+            options[label] = m.movieID
 
         selection_label = st.selectbox(
             "🎯 Select the correct movie:",
             list(options.keys()),
             help="Choose the exact movie you want to analyze"
         )
-        selected_movie_title = options[selection_label]
+        selected_movie_id = options[selection_label]
 
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
@@ -140,9 +188,9 @@ def main() -> None:
 
                 status_text.text("📥 Fetching reviews from IMDb...")
                 progress_bar.progress(25)
-                raw_reviews = fetch_reviews(selected_movie_title)
-
-                if not raw_reviews:
+                try:
+                    raw_reviews = fetch_reviews(selected_movie_id)
+                except NoReviewsFound:
                     st.error("❌ No reviews found for this movie.")
                     st.stop()
 
@@ -150,8 +198,6 @@ def main() -> None:
                 progress_bar.progress(50)
 
                 df = sentiment_pipeline(raw_reviews)
-                df['sentiment'] = df['polarity'].apply(polarity_bucket)
-                df['emoji'] = df['polarity'].apply(polarity_to_emoji)
 
                 status_text.text("🎯 Generating analysis report...")
                 progress_bar.progress(100)
@@ -252,10 +298,18 @@ def main() -> None:
                 st.altair_chart(chart, use_container_width=True)
 
             with tab2:
+                # Both ends of the polarity ranking via O(N) partitions instead of two sorts
+                p = df['polarity'].to_numpy()
+                k = min(3, len(p))
+                top_pos_idx = np.argpartition(p, -k)[-k:]
+                top_pos_idx = top_pos_idx[np.argsort(-p[top_pos_idx], kind='stable')]
+                top_neg_idx = np.argpartition(p, k - 1)[:k]
+                top_neg_idx = top_neg_idx[np.argsort(p[top_neg_idx], kind='stable')]
+
                 st.subheader("🌟 Top Positive Reviews")
                 st.caption("Here are the most positive viewer comments:")
 
-                top_positive = df.nlargest(3, 'polarity')
+                top_positive = df.iloc[top_pos_idx]
                 for _, row in top_positive.iterrows():
                     with st.container():
                         col1, col2 = st.columns([5, 1])
@@ -268,7 +322,7 @@ def main() -> None:
                 st.subheader("⚠️ Top Negative Reviews")
                 st.caption("Here are the most critical viewer comments:")
 
-                top_negative = df.nsmallest(3, 'polarity')
+                top_negative = df.iloc[top_neg_idx]
                 for _, row in top_negative.iterrows():
                     with st.container():
                         col1, col2 = st.columns([5, 1])
@@ -281,11 +335,17 @@ def main() -> None:
             with tab3:
                 st.subheader("Detailed Sentiment Analysis Charts")
 
+                # Only the charted columns are embedded in the Vega-Lite spec; rounding keeps
+                # the float32 scores from serializing as long decimals
+                chart_df = df[['polarity', 'subjectivity', 'sentiment']].astype(
+                    {'polarity': float, 'subjectivity': float}
+                ).round(3)
+
                 col1, col2 = st.columns(2)
 
                 with col1:
                     st.caption("**Polarity Distribution**")
-                    hist_polarity = alt.Chart(df).mark_bar().encode(
+                    hist_polarity = alt.Chart(chart_df).mark_bar().encode(
                         x=alt.X('polarity:Q', bin=alt.Bin(maxbins=20), title='Polarity (-1 to +1)'),
                         y=alt.Y('count()', title='Number of Reviews'),
                         color=alt.value('#2196F3')
@@ -294,7 +354,7 @@ def main() -> None:
 
                 with col2:
                     st.caption("**Subjectivity Distribution**")
-                    hist_subjectivity = alt.Chart(df).mark_bar().encode(
+                    hist_subjectivity = alt.Chart(chart_df).mark_bar().encode(
                         x=alt.X('subjectivity:Q', bin=alt.Bin(maxbins=20), title='Subjectivity (0 to 1)'),
                         y=alt.Y('count()', title='Number of Reviews'),
                         color=alt.value('#FF9800')
@@ -302,7 +362,7 @@ def main() -> None:
                     st.altair_chart(hist_subjectivity, use_container_width=True)
 
                 st.caption("**Polarity vs Subjectivity**")
-                scatter = alt.Chart(df.sample(min(500, len(df)))).mark_circle(size=60, opacity=0.6).encode(
+                scatter = alt.Chart(chart_df.sample(min(500, len(chart_df)))).mark_circle(size=60, opacity=0.6).encode(
                     x=alt.X('polarity:Q', title='Polarity', scale=alt.Scale(domain=[-1, 1])),
                     y=alt.Y('subjectivity:Q', title='Subjectivity', scale=alt.Scale(domain=[0, 1])),
                     color=alt.Color('sentiment:N', scale=alt.Scale(
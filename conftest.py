@@ -0,0 +1 @@
+# Puts the repository root on sys.path so tests can import utils/ under plain `pytest`
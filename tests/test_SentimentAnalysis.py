@@ -0,0 +1,38 @@
+import random
+
+import pytest
+from textblob import TextBlob
+
+from utils.SentimentAnalysis import WORD_SCORES, _score_review
+
+PHRASES = [
+    'great movie really good acting',
+    'not good plot',
+    'never good',
+    'never really good',
+    'really never good',
+    'really not good',
+    'not very bad',
+    'not a good film',
+    'really is a good movie',
+    'terribly boring never fun',
+    'movie plot',
+    '',
+]
+
+
+def _random_reviews(count=2000, seed=0):
+    rng = random.Random(seed)
+    words = [w for w in WORD_SCORES if w.isalpha()]
+    modifiers = [w for w in words if WORD_SCORES[w][3]]
+    pool = (rng.sample(words, 300) + rng.sample(modifiers, 50) * 3
+            + ['never', 'not', 'no'] * 20 + ['movie', 'plot', 'a', 'is', 'film'] * 10)
+    return [' '.join(rng.choice(pool) for _ in range(rng.randint(0, 25))) for _ in range(count)]
+
+
+@pytest.mark.parametrize('text', PHRASES + _random_reviews())
+def test_score_review_matches_textblob(text):
+    expected = TextBlob(text).sentiment
+    polarity, subjectivity = _score_review(text)
+    assert polarity == pytest.approx(expected.polarity, abs=1e-9)
+    assert subjectivity == pytest.approx(expected.subjectivity, abs=1e-9)
@@ -11,29 +11,18 @@ def search_movies(ia, movie_name):
     Returns:
         list: List of matching movie objects.
     """
-    results = ia.search_movie(movie_name)
+    return ia.search_movie(movie_name)
 
-    for i, movie in enumerate(results[:10]):
-        print(f"{i+1}. {movie['title']} ({movie.get('year', 'N/A')})")
 
-    return results
-
-
-def find_and_get_reviews_link(ia, movie_name):
-    # Search for the movie
-    results = ia.search_movie(movie_name)
-
-    if results:
-        # Take the first result
-        movie = results[0]
-        movie_id = movie.movieID
-
-        # Build the IMDb reviews link
-        reviews_link = f"https://www.imdb.com/title/tt{movie_id}/reviews"
-
-        print(f"Movie found: {movie['title']} ({movie.get('year', 'N/A')})")
-        print(f"Reviews link: {reviews_link}")
+def get_title_id(movie_id):
+    """
+    Builds the IMDb title id for a movie already picked from search results,
+    so no second search round-trip is needed.
 
-        return reviews_link
+    Parameters:
+        movie_id (str): The Cinemagoer movieID (digits only).
 
-    return None
\ No newline at end of file
+    Returns:
+        str: The IMDb title id (e.g. "tt0133093").
+    """
+    return f"tt{movie_id}"
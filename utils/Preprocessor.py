@@ -1,18 +1,32 @@
 import pandas as pd
 import re
+import functools
 import nltk
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 
-# Download necessary NLTK resources
-nltk.download('stopwords', quiet=True)
-nltk.download('wordnet', quiet=True)
-nltk.download('omw-1.4', quiet=True)
+# Download necessary NLTK resources (only if not already installed)
+for res, path in [('stopwords', 'corpora/stopwords'), ('wordnet', 'corpora/wordnet'), ('omw-1.4', 'corpora/omw-1.4')]:
+    try:
+        nltk.data.find(path)
+    except LookupError:
+        nltk.download(res, quiet=True)
 
 # Initialize tools
-stop_words = set(stopwords.words('english'))
+stop_words = frozenset(stopwords.words('english'))
 lemmatizer = WordNetLemmatizer()
 
+# Words are runs of letters, so punctuation and digits never reach the filters
+TOKEN = re.compile(r'[a-z]+')
+
+@functools.lru_cache(maxsize=50000)
+def _lem(word: str) -> str:
+    # Reviews share a small vocabulary, so most lookups never reach WordNet
+    return lemmatizer.lemmatize(word)
+
+def _clean(review: str) -> str:
+    return ' '.join(_lem(w) for w in TOKEN.findall(review.lower()) if w not in stop_words)
+
 def preprocess_reviews(reviews: pd.Series) -> pd.Series:
     """
     Preprocesses a Series of text reviews by:
@@ -27,20 +41,5 @@ def preprocess_reviews(reviews: pd.Series) -> pd.Series:
     Returns:
         pd.Series: Series of lemmatized and cleaned reviews.
     """
-    # Lowercase
-    reviews = reviews.str.lower()
-
-    # Remove punctuation
-    reviews = reviews.str.replace(r'[^\w\s]', '', regex=True)
-
-    # Remove stopwords
-    reviews = reviews.apply(lambda x: ' '.join(
-        word for word in x.split() if word not in stop_words
-    ))
-
-    # Lemmatize
-    reviews = reviews.apply(lambda x: ' '.join(
-        lemmatizer.lemmatize(word) for word in x.split()
-    ))
-
-    return reviews
+    # Lowercase, tokenize, drop stopwords and lemmatize in one pass per review
+    return reviews.apply(_clean)
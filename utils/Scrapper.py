@@ -1,79 +1,176 @@
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import lxml.html
+import asyncio
+import httpx
 
-def extract_imdb_reviews(url, waiting_timeout=8):
+GRAPHQL_URL = "https://api.graphql.imdb.com/"
+
+# Same data the reviews page requests through its TitleReviewsRefine operation
+REVIEWS_QUERY = """
+query TitleReviewsRefine($const: ID!, $first: Int!, $after: ID) {
+  title(id: $const) {
+    reviews(first: $first, after: $after) {
+      edges { node { text { originalText { plainText } } } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# Roughly what the "All" button used to load on the reviews page (a few hundred reviews),
+# so popular titles don't page through thousands of reviews
+MAX_REVIEWS = 1000
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+class NoReviewsFound(LookupError):
+    """Raised when neither the API nor the scraper returns any review for a title."""
+
+async def _fetch(tconst, page_size=250, max_reviews=MAX_REVIEWS):
+    reviews = []
+    cursor = None
+
+    async with httpx.AsyncClient(http2=True, headers={"User-Agent": USER_AGENT}, timeout=15) as client:
+        while len(reviews) < max_reviews:
+            response = await client.post(GRAPHQL_URL, json={
+                "operationName": "TitleReviewsRefine",
+                "query": REVIEWS_QUERY,
+                "variables": {"const": tconst, "first": min(page_size, max_reviews - len(reviews)), "after": cursor},
+            })
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get("errors"):
+                raise RuntimeError(payload["errors"][0].get("message", "IMDb GraphQL error"))
+
+            title = (payload.get("data") or {}).get("title")
+            if title is None:
+                raise RuntimeError(f"IMDb GraphQL returned no title for {tconst}")
+
+            page = title["reviews"]
+            for edge in page["edges"]:
+                text = (edge["node"].get("text") or {}).get("originalText") or {}
+                if text.get("plainText"):
+                    reviews.append(text["plainText"])
+
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            cursor = page["pageInfo"]["endCursor"]
+
+    return reviews[:max_reviews]
+
+def fetch_imdb_reviews(tconst, page_size=250, max_reviews=MAX_REVIEWS):
     """
-    Scrapes IMDB user reviews from the given URL.
+    Fetches IMDB user reviews directly from IMDb's GraphQL API, without a browser.
 
     Args:
-        url (str): The URL of the IMDB reviews page.
-        waiting_timeout (int): Maximum number of seconds to wait after clicking the "All" button,
-                               allowing all reviews to fully load.
+        tconst (str): The IMDb title id (e.g. "tt0133093").
+        page_size (int): Number of reviews requested per page.
+        max_reviews (int): Stop paging once this many reviews have been collected.
 
     Returns:
-        List[str]: A list of extracted review texts.
+        List[str]: A list of review texts.
+    """
+    return asyncio.run(_fetch(tconst, page_size, max_reviews))
+
+
+def review_count_stable():
+    """
+    Builds a WebDriverWait condition that is met once the number of loaded
+    reviews is non-zero and unchanged since the previous poll.
+
+    Returns:
+        Callable[[webdriver.Chrome], bool]: The wait condition.
+    """
+    last = -1
+
+    def check(driver):
+        nonlocal last
+        count = driver.execute_script("return document.querySelectorAll('div.ipc-html-content-inner-div').length")
+        stable = count == last and count > 0
+        last = count
+        return stable
+
+    return check
+
+def create_driver():
+    """
+    Starts a headless Chrome driver configured for scraping IMDb.
+
+    Returns:
+        webdriver.Chrome: A new driver instance.
     """
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    options.add_argument(f"--user-agent={USER_AGENT}")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-web-security")
     options.add_argument("--disable-features=VizDisplayCompositor")
 
-    driver = webdriver.Chrome(options=options)
-
-    try:
-        driver.get(url)
+    return webdriver.Chrome(options=options)
 
-        wait = WebDriverWait(driver, 10)
-
-        all_button_clicked = False
+def extract_imdb_reviews(url, waiting_timeout=8, driver=None):
+    """
+    Scrapes IMDB user reviews from the given URL.
 
-        # Try to locate and click the "All" button using general XPath
-        if not all_button_clicked:
-            try:
-                all_buttons = driver.find_elements(By.XPATH, '//button[contains(@class, "ipc-see-more")]')
-                for button in all_buttons:
-                    if 'All' in button.text:
-                        driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                        time.sleep(0.5)
-                        driver.execute_script("arguments[0].click();", button)
-                        all_button_clicked = True
-                        break
-            except Exception:
-                pass
+    Args:
+        url (str): The URL of the IMDB reviews page.
+        waiting_timeout (int): Maximum number of seconds to wait after clicking the "All" button,
+                               allowing all reviews to fully load.
+        driver (webdriver.Chrome): Optional driver to reuse. It is reset after scraping
+                                   instead of quit; if omitted, a temporary one is started.
 
-        # Wait for reviews to load after clicking the "All" button
-        if all_button_clicked:
-            time.sleep(waiting_timeout)
-        else:
-            time.sleep(3)
+    Returns:
+        List[str]: A list of extracted review texts.
+    """
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_driver()
 
-        # Extract HTML and parse with BeautifulSoup
-        html = driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
+    try:
+        driver.get(url)
 
-        reviews = []
+        # Find and click the "All" button in the page itself (one round-trip)
+        try:
+            all_button_clicked = bool(driver.execute_script("""
+                const button = [...document.querySelectorAll('button.ipc-see-more')]
+                    .find(el => el.innerText.includes('All'));
+                if (button) { button.scrollIntoView(); button.click(); return true; }
+                return false;
+            """))
+        except Exception:
+            all_button_clicked = False
 
-        # Main selector
-        results = soup.find_all('div', {'class': 'ipc-html-content-inner-div'})
-        reviews.extend([review.get_text(strip=True) for review in results])
+        # Wait until the review count stops growing, at most waiting_timeout seconds
+        # after clicking the "All" button (3 seconds otherwise)
+        try:
+            WebDriverWait(driver, waiting_timeout if all_button_clicked else 3, poll_frequency=0.5).until(
+                review_count_stable()
+            )
+        except TimeoutException:
+            pass
 
-        # Fallback selector if none found
-        if not reviews:
-            results = soup.find_all('div', {'class': 'text show-more__control'})
-            reviews.extend([review.get_text(strip=True) for review in results])
+        # Extract HTML and parse with lxml (main selector, then the legacy layout)
+        tree = lxml.html.fromstring(driver.page_source)
+        nodes = tree.cssselect('div.ipc-html-content-inner-div') or tree.cssselect('div.text.show-more__control')
 
-        return reviews
+        return [' '.join(node.text_content().split()) for node in nodes]
 
     finally:
-        driver.quit()
+        if owns_driver:
+            driver.quit()
+        else:
+            # Leave the reused driver clean for the next fetch; a crashed driver must
+            # not replace the scrape's own result or exception
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except WebDriverException:
+                pass
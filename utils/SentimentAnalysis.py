@@ -1,22 +1,174 @@
+import os
+import functools
+import numpy as np
 import pandas as pd
-from textblob import TextBlob
+from joblib import Parallel, delayed
+from textblob.en import sentiment as lexicon
 
-def analyze_sentiment(reviews: pd.Series, reviews_raw: pd.Series) -> pd.DataFrame:
+# Words that flip and halve the polarity of the next known word (TextBlob's list)
+NEGATIONS = frozenset(lexicon.negations)
+
+# VADER's emoticon handling degrades badly on very long inputs
+MAX_VADER_CHARS = 5000
+
+# Below this many reviews, starting worker processes costs more than it saves
+PARALLEL_MIN_REVIEWS = 20000
+
+
+def _load_lexicon() -> dict:
+    """
+    Loads TextBlob's en-sentiment.xml lexicon once into a plain lookup table.
+
+    TextBlob already averages duplicate senses of a word (e.g. "great") per
+    part-of-speech and across tags under the None key, which is what it uses
+    for untagged text, so those averaged scores are copied as-is.
+
+    Returns:
+        dict: Maps each word to (polarity, subjectivity, intensity, is_modifier).
+    """
+    lexicon.load()
+    return {
+        # Adverbs ("really", "terribly") intensify the next word
+        w: (*map(float, pos[None]), any(tag in pos for tag in lexicon.modifiers))
+        for w, pos in dict.items(lexicon) if None in pos
+    }
+
+
+WORD_SCORES = _load_lexicon()
+
+
+def _score_review(text: str) -> tuple:
+    """
+    Scores a single preprocessed review against the lexicon.
+
+    Follows TextBlob's pattern analyzer (Sentiment.assessments) word for word:
+    only known words are averaged, a modifier ("really good") scales and merges
+    into the next known word, and a negation ("not really good") stays pending
+    until the next known word, inverts the modifier's intensity and multiplies the
+    final polarity by -0.5. Punctuation and emoticon rules are left out because
+    preprocessed reviews only contain letters.
+
+    Parameters:
+        text (str): A whitespace-separated, lowercased review.
+
+    Returns:
+        tuple: (polarity, subjectivity) of the review.
+    """
+    assessments = []  # [polarity, subjectivity, intensity, negated]
+    modifier = None
+    negation = None
+
+    for w in text.split():
+        scores = WORD_SCORES.get(w)
+        if scores is not None:
+            p, s, i, is_modifier = scores
+            if modifier is None:
+                assessments.append([p, s, i, False])
+            else:
+                last = assessments[-1]
+                last[0] = max(-1.0, min(p * last[2], 1.0))
+                last[1] = max(-1.0, min(s * last[2], 1.0))
+                last[2] = i
+            if negation is not None:
+                assessments[-1][2] = 1.0 / assessments[-1][2]
+                assessments[-1][3] = True
+            modifier = w if is_modifier else None
+            negation = w if w in NEGATIONS else None
+        else:
+            if w in NEGATIONS:
+                negation = w
+            # Negations carry across small words ("not a good")
+            elif negation is not None and len(w.strip("'")) > 1:
+                negation = None
+            # "really not good" negates the modifier's assessment
+            if negation is not None and modifier is not None and modifier.endswith('ly'):
+                assessments[-1][3] = True
+                negation = None
+            # Modifiers carry across small words ("really is a good")
+            elif modifier is not None and len(w) > 2:
+                modifier = None
+
+    if not assessments:
+        return 0.0, 0.0
+
+    # "not good" = slightly bad, "not bad" = slightly good
+    polarity = sum(p * -0.5 if negated else p for p, _, _, negated in assessments)
+    subjectivity = sum(s for _, s, _, _ in assessments)
+    return polarity / len(assessments), subjectivity / len(assessments)
+
+
+@functools.lru_cache(maxsize=None)
+def _vader():
+    # vaderSentiment is optional, so it is only imported when requested
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+def _score_vader(text: str) -> tuple:
     """
-    Analyzes the sentiment of each review using TextBlob.
+    Scores a single raw review with VADER.
+
+    Parameters:
+        text (str): The original review text.
+
+    Returns:
+        tuple: (polarity, subjectivity), using the compound score as polarity
+               and the non-neutral share of the text as subjectivity.
+    """
+    scores = _vader().polarity_scores(text[:MAX_VADER_CHARS])
+    return scores['compound'], 1.0 - scores['neu']
+
+
+SCORERS = {
+    'textblob': _score_review,
+    'vader': _score_vader,
+}
+
+
+def _score(batch, backend: str = 'textblob') -> np.ndarray:
+    score_review = SCORERS[backend]
+    # float32 is plenty for scores in [-1, 1] and halves the cached DataFrame
+    scores = np.empty((len(batch), 2), dtype=np.float32)
+    for i, x in enumerate(batch):
+        scores[i] = score_review(x)
+    return scores
+
+
+def analyze_sentiment(reviews: pd.Series, reviews_raw: pd.Series, n_jobs: int = None,
+                      backend: str = 'textblob') -> pd.DataFrame:
+    """
+    Analyzes the sentiment of each review using the TextBlob lexicon or VADER.
+
+    Large inputs are split into one chunk per worker and scored in parallel
+    processes, since every review is independent.
 
     Parameters:
         reviews (pd.Series): A Series of lemmatized review texts.
+        reviews_raw (pd.Series): The original review texts, kept for display.
+        n_jobs (int): Number of worker processes (defaults to the CPU count).
+        backend (str): 'textblob' scores the lemmatized reviews against the TextBlob
+                       lexicon; 'vader' scores the raw reviews with vaderSentiment.
 
     Returns:
         pd.DataFrame: A DataFrame with 'polarity' and 'subjectivity' columns.
     """
-    polarity = reviews.apply(lambda x: TextBlob(x).sentiment.polarity)
-    subjectivity = reviews.apply(lambda x: TextBlob(x).sentiment.subjectivity)
+    if backend not in SCORERS:
+        raise ValueError(f"Unknown sentiment backend: {backend!r}")
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    texts = reviews.to_numpy()
+    # VADER relies on casing and punctuation, so it scores the original text
+    inputs = reviews_raw.to_numpy() if backend == 'vader' else texts
+
+    if n_jobs == 1 or len(inputs) < PARALLEL_MIN_REVIEWS:
+        scores = _score(inputs, backend)
+    else:
+        chunks = np.array_split(inputs, n_jobs)
+        scores = np.concatenate(Parallel(n_jobs=n_jobs, backend='loky')(delayed(_score)(chunk, backend) for chunk in chunks))
 
     return pd.DataFrame({
-        'raw_reviews': reviews_raw,
-        'reviews' : reviews,
-        'polarity': polarity,
-        'subjectivity': subjectivity
-    })
+        'raw_reviews': reviews_raw.to_numpy(),
+        'reviews' : texts,
+        'polarity': scores[:, 0],
+        'subjectivity': scores[:, 1]
+    }, index=reviews.index, copy=False)